@@ -33,16 +33,21 @@ import infertrade.utilities.operations as operations
 import infertrade.algos.community.signals as signals
 from infertrade.algos.community.permalinks import data_dictionary
 
+# Column names used throughout, resolved once rather than on every call.
+_ALLOC = PandasEnum.ALLOCATION.value
+_MID = PandasEnum.MID.value
+_SIG = PandasEnum.SIGNAL.value
+
 
 def fifty_fifty(dataframe) -> pd.DataFrame:
     """Allocates 50% of strategy budget to asset, 50% to cash."""
-    dataframe["allocation"] = 0.5
+    dataframe["allocation"] = np.full(len(dataframe), 0.5)
     return dataframe
 
 
 def buy_and_hold(dataframe: pd.DataFrame) -> pd.DataFrame:
     """Allocates 100% of strategy budget to asset, holding to end of period (or security bankruptcy)."""
-    dataframe[PandasEnum.ALLOCATION.value] = 1.0
+    dataframe[_ALLOC] = np.full(len(dataframe), 1.0)
     return dataframe
 
 
@@ -55,24 +60,24 @@ def chande_kroll_crossover_strategy(dataframe: pd.DataFrame,) -> pd.DataFrame:
     the asset or allocates 100% of the portfolio to a short position on the asset when the price of the asset is below
     both the Chande Kroll stop long line and the Chande Kroll stop short line.
     """
-    # Calculate the Chande Kroll lines, which will be added to the DataFrame as columns named "chande_kroll_long" and
-    # "chande_kroll_short".
-    dataframe = signals.chande_kroll(dataframe)
+    # Calculate the Chande Kroll lines as arrays, so that no intermediate columns are added to the DataFrame.
+    chande_kroll_long, chande_kroll_short = signals._chande_kroll_arrays(dataframe)
 
     # Allocate positions according to the Chande Kroll lines
-    is_price_above_lines = (dataframe["price"] > dataframe["chande_kroll_long"]) & (
-        dataframe["price"] > dataframe["chande_kroll_short"]
-    )
-    is_price_below_lines = (dataframe["price"] < dataframe["chande_kroll_long"]) & (
-        dataframe["price"] < dataframe["chande_kroll_short"]
+    price = dataframe["price"].to_numpy()
+    is_price_above_lines = price > np.maximum(chande_kroll_long, chande_kroll_short)
+    is_price_below_lines = price < np.minimum(chande_kroll_long, chande_kroll_short)
+
+    # Prices between the lines leave any existing allocation unchanged.
+    if _ALLOC in dataframe.columns:
+        unchanged_allocation = dataframe[_ALLOC].to_numpy(dtype="float64")
+    else:
+        unchanged_allocation = np.nan
+
+    dataframe[_ALLOC] = np.select(
+        [is_price_above_lines, is_price_below_lines], [1.0, -1.0], default=unchanged_allocation
     )
 
-    dataframe.loc[is_price_above_lines, PandasEnum.ALLOCATION.value] = 1.0
-    dataframe.loc[is_price_below_lines, PandasEnum.ALLOCATION.value] = -1.0
-
-    # Delete the columns with the Chande Kroll indicators before returning
-    dataframe.drop(columns=["chande_kroll_long", "chande_kroll_short"], inplace=True)
-
     return dataframe
 
 
@@ -89,8 +94,8 @@ def change_relationship(dataframe: pd.DataFrame) -> pd.DataFrame:
     regression_period = 120
     minimum_length_to_calculate = regression_period + 1
 
-    if len(df[PandasEnum.MID.value]) < minimum_length_to_calculate:
-        df[PandasEnum.ALLOCATION.value] = 0.0
+    if len(df[_MID]) < minimum_length_to_calculate:
+        df[_ALLOC] = np.zeros(len(df))
         return df
 
     df = calculate_change_relationship(df, regression_period)
@@ -112,8 +117,8 @@ def change_relationship_oos(dataframe: pd.DataFrame) -> pd.DataFrame:
     regression_period = 120
     minimum_length_to_calculate = regression_period + 1
 
-    if len(df[PandasEnum.MID.value]) < minimum_length_to_calculate:
-        df[PandasEnum.ALLOCATION.value] = 0.0
+    if len(df[_MID]) < minimum_length_to_calculate:
+        df[_ALLOC] = np.zeros(len(df))
         return df
 
     df = calculate_change_relationship(df, regression_period, out_of_sample_error=out_of_sample_error)
@@ -125,22 +130,19 @@ def calculate_change_relationship(
     df: pd.DataFrame, regression_period: int = 120, kelly_fraction: float = 1.0, out_of_sample_error: bool = False
 ) -> pd.DataFrame:
     """Calculates allocations for change relationship."""
-    dataframe = df.copy()
-    dataframe[PandasEnum.SIGNAL.value] = dataframe["research"]
+    signal = df["research"].to_numpy()
     forecast_period = 100
-    signal_lagged = operations.lag(
-        np.reshape(dataframe[PandasEnum.SIGNAL.value].append(pd.Series([0])).values, (-1, 1)), shift=1
-    )
+    signal_lagged = operations.lag(np.reshape(np.append(signal, 0), (-1, 1)), shift=1)
     signal_lagged_pct_change = operations.pct_chg(signal_lagged)
     signal_lagged_pct_change[0] = [0.0]
     signal_lagged_pct_change[1] = [0.0]
     last_feature_row = signal_lagged_pct_change[-1:]
     signal_lagged_pct_change = signal_lagged_pct_change[:-1]
-    price_pct_chg = operations.pct_chg(dataframe[PandasEnum.MID.value])
+    price_pct_chg = operations.pct_chg(df[_MID])
     price_pct_chg[0] = [0.0]
 
-    dataframe = operations.calculate_regression_with_kelly_optimum(
-        dataframe,
+    allocations = operations.calculate_regression_allocations_with_kelly_optimum(
+        df,
         feature_matrix=signal_lagged_pct_change,
         last_feature_row=last_feature_row,
         target_array=price_pct_chg,
@@ -149,6 +151,7 @@ def calculate_change_relationship(
         kelly_fraction=kelly_fraction,
         out_of_sample_error=out_of_sample_error,
     )
+    dataframe = df.assign(**{_SIG: signal, _ALLOC: allocations})
 
     return dataframe
 
@@ -167,8 +170,8 @@ def combination_relationship(dataframe: pd.DataFrame) -> pd.DataFrame:
     df = dataframe.copy()
     regression_period = 120
     minimum_length_to_calculate = regression_period + 1
-    if len(df[PandasEnum.MID.value]) < minimum_length_to_calculate:
-        df[PandasEnum.ALLOCATION.value] = 0.0
+    if len(df[_MID]) < minimum_length_to_calculate:
+        df[_ALLOC] = np.zeros(len(df))
         return df
 
     df = calculate_combination_relationship(df, regression_period)
@@ -191,8 +194,8 @@ def combination_relationship_oos(dataframe: pd.DataFrame) -> pd.DataFrame:
     out_of_sample_error = True
     regression_period = 120
     minimum_length_to_calculate = regression_period + 1
-    if len(df[PandasEnum.MID.value]) < minimum_length_to_calculate:
-        df[PandasEnum.ALLOCATION.value] = 0.0
+    if len(df[_MID]) < minimum_length_to_calculate:
+        df[_ALLOC] = np.zeros(len(df))
         return df
 
     df = calculate_combination_relationship(df, regression_period, out_of_sample_error=out_of_sample_error)
@@ -204,12 +207,9 @@ def calculate_combination_relationship(
     df: pd.DataFrame, regression_period: int = 120, kelly_fraction: float = 1.0, out_of_sample_error: bool = False
 ):
     """Calculates allocations for combination relationship."""
-    dataframe = df.copy()
-    dataframe[PandasEnum.SIGNAL.value] = dataframe.loc[:, "research"]
+    signal = df["research"].to_numpy()
     forecast_period = 100
-    signal_lagged = operations.lag(
-        np.reshape(dataframe[PandasEnum.SIGNAL.value].append(pd.Series([0])).values, (-1, 1)), shift=1
-    )
+    signal_lagged = operations.lag(np.reshape(np.append(signal, 0), (-1, 1)), shift=1)
     signal_lagged[0] = [0.0]
     signal_lagged_pct_change = operations.pct_chg(signal_lagged)
     signal_lagged_pct_change[0] = [0.0]
@@ -217,8 +217,8 @@ def calculate_combination_relationship(
     signal_differenced = operations.research_over_price_minus_one(
         np.column_stack(
             (
-                dataframe[PandasEnum.MID.value].append(pd.Series([0])).values,
-                dataframe[PandasEnum.SIGNAL.value].append(pd.Series([0])).values,
+                np.append(df[_MID].to_numpy(), 0),
+                np.append(signal, 0),
             )
         ),
         shift=1,
@@ -227,11 +227,11 @@ def calculate_combination_relationship(
     intermediate_matrix = np.column_stack((signal_lagged, signal_lagged_pct_change, signal_differenced))
     last_feature_row = intermediate_matrix[-1:]
     intermediate_matrix = intermediate_matrix[:-1]
-    price_pct_chg = operations.pct_chg(dataframe[PandasEnum.MID.value])
+    price_pct_chg = operations.pct_chg(df[_MID])
     price_pct_chg[0] = [0.0]
 
-    dataframe = operations.calculate_regression_with_kelly_optimum(
-        dataframe,
+    allocations = operations.calculate_regression_allocations_with_kelly_optimum(
+        df,
         feature_matrix=intermediate_matrix,
         last_feature_row=last_feature_row,
         target_array=price_pct_chg,
@@ -240,6 +240,7 @@ def calculate_combination_relationship(
         kelly_fraction=kelly_fraction,
         out_of_sample_error=out_of_sample_error,
     )
+    dataframe = df.assign(**{_SIG: signal, _ALLOC: allocations})
 
     return dataframe
 
@@ -251,7 +252,7 @@ def constant_allocation_size(dataframe: pd.DataFrame, fixed_allocation_size: flo
     parameters:
     fixed_allocation_size: determines allocation size.
     """
-    dataframe[PandasEnum.ALLOCATION.value] = fixed_allocation_size
+    dataframe[_ALLOC] = np.full(len(dataframe), fixed_allocation_size)
     return dataframe
 
 
@@ -267,8 +268,8 @@ def difference_relationship(dataframe: pd.DataFrame) -> pd.DataFrame:
     df = dataframe.copy()
     regression_period = 120
     minimum_length_to_calculate = regression_period + 1
-    if len(df[PandasEnum.MID.value]) < minimum_length_to_calculate:
-        df[PandasEnum.ALLOCATION.value] = 0.0
+    if len(df[_MID]) < minimum_length_to_calculate:
+        df[_ALLOC] = np.zeros(len(df))
         return df
 
     df = calculate_difference_relationship(df, regression_period)
@@ -289,8 +290,8 @@ def difference_relationship_oos(dataframe: pd.DataFrame) -> pd.DataFrame:
     out_of_sample_error = True
     regression_period = 120
     minimum_length_to_calculate = regression_period + 1
-    if len(df[PandasEnum.MID.value]) < minimum_length_to_calculate:
-        df[PandasEnum.ALLOCATION.value] = 0.0
+    if len(df[_MID]) < minimum_length_to_calculate:
+        df[_ALLOC] = np.zeros(len(df))
         return df
 
     df = calculate_difference_relationship(df, regression_period, out_of_sample_error=out_of_sample_error)
@@ -302,14 +303,13 @@ def calculate_difference_relationship(
     df: pd.DataFrame, regression_period: int = 120, kelly_fraction: float = 1.0, out_of_sample_error: bool = False
 ):
     """Calculates allocations for difference relationship."""
-    dataframe = df.copy()
-    dataframe[PandasEnum.SIGNAL.value] = dataframe["research"]
+    signal = df["research"].to_numpy()
     forecast_period = 100
     signal_differenced = operations.research_over_price_minus_one(
         np.column_stack(
             (
-                dataframe[PandasEnum.MID.value].append(pd.Series([0])).values,
-                dataframe[PandasEnum.SIGNAL.value].append(pd.Series([0])).values,
+                np.append(df[_MID].to_numpy(), 0),
+                np.append(signal, 0),
             )
         ),
         shift=1,
@@ -317,11 +317,11 @@ def calculate_difference_relationship(
     signal_differenced[0] = [0.0]
     last_feature_row = signal_differenced[-1:]
     signal_differenced = signal_differenced[:-1]
-    price_pct_chg = operations.pct_chg(dataframe[PandasEnum.MID.value])
+    price_pct_chg = operations.pct_chg(df[_MID])
     price_pct_chg[0] = [0.0]
 
-    dataframe = operations.calculate_regression_with_kelly_optimum(
-        dataframe,
+    allocations = operations.calculate_regression_allocations_with_kelly_optimum(
+        df,
         feature_matrix=signal_differenced,
         last_feature_row=last_feature_row,
         target_array=price_pct_chg,
@@ -330,6 +330,8 @@ def calculate_difference_relationship(
         kelly_fraction=kelly_fraction,
         out_of_sample_error=out_of_sample_error,
     )
+    dataframe = df.assign(**{_SIG: signal, _ALLOC: allocations})
+
     return dataframe
 
 
@@ -342,7 +344,14 @@ def high_low_difference(dataframe: pd.DataFrame, scale: float = 1.0, constant: f
     scale: determines amplitude factor.
     constant: scalar value added to the allocation size.
     """
-    dataframe[PandasEnum.ALLOCATION.value] = (dataframe["high"] - dataframe["low"]) * scale + constant
+    high = dataframe["high"].to_numpy(dtype="float64")
+    low = dataframe["low"].to_numpy(dtype="float64")
+
+    # Scales and offsets the difference in place, so that only one array is allocated.
+    allocation = np.subtract(high, low)
+    allocation *= scale
+    allocation += constant
+    dataframe[_ALLOC] = allocation
     return dataframe
 
 
@@ -358,8 +367,8 @@ def level_relationship(dataframe: pd.DataFrame) -> pd.DataFrame:
     df = dataframe.copy()
     regression_period = 120
     minimum_length_to_calculate = regression_period + 1
-    if len(df[PandasEnum.MID.value]) < minimum_length_to_calculate:
-        df[PandasEnum.ALLOCATION.value] = 0.0
+    if len(df[_MID]) < minimum_length_to_calculate:
+        df[_ALLOC] = np.zeros(len(df))
         return df
 
     df = calculate_level_relationship(df, regression_period)
@@ -380,8 +389,8 @@ def level_relationship_oos(dataframe: pd.DataFrame) -> pd.DataFrame:
     out_of_sample_error = True
     regression_period = 120
     minimum_length_to_calculate = regression_period + 1
-    if len(df[PandasEnum.MID.value]) < minimum_length_to_calculate:
-        df[PandasEnum.ALLOCATION.value] = 0.0
+    if len(df[_MID]) < minimum_length_to_calculate:
+        df[_ALLOC] = np.zeros(len(df))
         return df
 
     df = calculate_level_relationship(df, regression_period, out_of_sample_error=out_of_sample_error)
@@ -393,21 +402,18 @@ def calculate_level_relationship(
     df: pd.DataFrame, regression_period: int = 120, kelly_fraction: float = 1.0, out_of_sample_error: bool = False
 ):
     """Calculates allocations for level relationship."""
-    dataframe = df.copy()
-    dataframe[PandasEnum.SIGNAL.value] = dataframe.loc[:, "research"]
+    signal = df["research"].to_numpy()
     forecast_period = 100
-    signal_lagged = operations.lag(
-        np.reshape(dataframe[PandasEnum.SIGNAL.value].append(pd.Series([0])).values, (-1, 1)), shift=1
-    )  # revert back to manually calculating last row? doing it manually seems awkward, doing it this way seems
-    # wasteful, altering the the lag (or other) function seems hacky
-    signal_lagged[0] = [0.0]
-    last_feature_row = signal_lagged[-1:]
-    signal_lagged = signal_lagged[:-1]
-    price_pct_chg = operations.pct_chg(dataframe[PandasEnum.MID.value])
+    # The regression on a single feature works with one dimensional arrays, so the lag is taken directly.
+    signal_lagged = np.empty(len(signal), dtype="float64")
+    signal_lagged[:1] = 0.0
+    signal_lagged[1:] = signal[:-1]
+    last_feature_row = signal[-1:].astype("float64")
+    price_pct_chg = operations.pct_chg(df[_MID])
     price_pct_chg[0] = [0.0]
 
-    dataframe = operations.calculate_regression_with_kelly_optimum(
-        dataframe,
+    allocations = operations.calculate_regression_allocations_with_kelly_optimum(
+        df,
         feature_matrix=signal_lagged,
         last_feature_row=last_feature_row,
         target_array=price_pct_chg,
@@ -416,6 +422,7 @@ def calculate_level_relationship(
         kelly_fraction=kelly_fraction,
         out_of_sample_error=out_of_sample_error,
     )
+    dataframe = df.assign(**{_SIG: signal, _ALLOC: allocations})
 
     return dataframe
 
@@ -433,10 +440,11 @@ def sma_crossover_strategy(dataframe: pd.DataFrame, fast: int = 0, slow: int = 0
     price = dataframe["price"]
 
     # Compute Fast and Slow SMA
-    fast_sma = price.rolling(window=fast, min_periods=fast).mean()
-    slow_sma = price.rolling(window=slow, min_periods=slow).mean()
-    position = np.where(fast_sma > slow_sma, 1.0, 0.0)
-    dataframe[PandasEnum.ALLOCATION.value] = position
+    fast_sma = price.rolling(window=fast, min_periods=fast).mean().to_numpy()
+    slow_sma = price.rolling(window=slow, min_periods=slow).mean().to_numpy()
+    position = np.empty(len(price), dtype="float64")
+    np.greater(fast_sma, slow_sma, out=position)
+    dataframe[_ALLOC] = position
     return dataframe
 
 
@@ -464,22 +472,21 @@ def weighted_moving_averages(
     avg_research_length: determines length of average of research series.
     """
 
-    # Splits out the price/research df to individual pandas Series.
-    price = dataframe[PandasEnum.MID.value]
+    # Splits out the price/research df to individual series.
+    price = dataframe[_MID]
     research = dataframe["research"]
 
-    # Calculates the averages.
-    avg_price = price.rolling(window=avg_price_length).mean()
-    avg_research = research.rolling(window=avg_research_length).mean()
-
-    # Weights each average by the scalar coefficients.
-    price_total = avg_price_coeff * avg_price
-    research_total = avg_research_coeff * avg_research
+    # Weights each average by the scalar coefficients, accumulating into a single array.
+    position = price.rolling(window=avg_price_length).mean().to_numpy(dtype="float64", copy=True)
+    position *= avg_price_coeff
+    research_total = research.rolling(window=avg_research_length).mean().to_numpy(dtype="float64", copy=True)
+    research_total *= avg_research_coeff
 
     # Sums the contributions and normalises by the level of the price.
     # N.B. as summing, this approach assumes that research signal is of same dimensionality as the price.
-    position = (price_total + research_total) / price.values
-    dataframe[PandasEnum.ALLOCATION.value] = position
+    position += research_total
+    position /= price.to_numpy(dtype="float64")
+    dataframe[_ALLOC] = position
     return dataframe
 
 
@@ -495,7 +502,7 @@ def change_regression(
     """
     research = dataframe["research"]
     position = (research / research.shift(1) - 1) * change_coefficient + change_constant
-    dataframe[PandasEnum.ALLOCATION.value] = position
+    dataframe[_ALLOC] = position
     return dataframe
 
 
@@ -513,7 +520,7 @@ def difference_regression(
     research = dataframe["research"]
     price = dataframe["price"]
     position = (research / price - 1) * difference_coefficient + difference_constant
-    dataframe[PandasEnum.ALLOCATION.value] = position
+    dataframe[_ALLOC] = position
     return dataframe
 
 
@@ -530,7 +537,7 @@ def level_regression(
 
     research = dataframe["research"]
     position = research * level_coefficient + level_constant
-    dataframe[PandasEnum.ALLOCATION.value] = position
+    dataframe[_ALLOC] = position
     return dataframe
 
 
@@ -556,7 +563,7 @@ def level_and_change_regression(
         + (research / research.shift(1) - 1) * change_coefficient
         + level_and_change_constant
     )
-    dataframe[PandasEnum.ALLOCATION.value] = position
+    dataframe[_ALLOC] = position
     return dataframe
 
 
@@ -602,8 +609,8 @@ def SMA_strategy(df: pd.DataFrame, window: int = 1, max_investment: float = 0.1)
     price_above_signal = df["close"] > sma
     price_below_signal = df["close"] <= sma
 
-    df.loc[price_above_signal, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[price_below_signal, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[price_above_signal, _ALLOC] = max_investment
+    df.loc[price_below_signal, _ALLOC] = -max_investment
     return df
 
 
@@ -617,8 +624,8 @@ def WMA_strategy(df: pd.DataFrame, window: int = 1, max_investment: float = 0.1)
     price_above_signal = df["close"] > wma
     price_below_signal = df["close"] <= wma
 
-    df.loc[price_above_signal, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[price_below_signal, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[price_above_signal, _ALLOC] = max_investment
+    df.loc[price_below_signal, _ALLOC] = -max_investment
     return df
 
 
@@ -634,8 +641,8 @@ def MACD_strategy(
     signal_above_zero_line = macd_signal > 0
     signal_below_zero_line = macd_signal <= 0
 
-    df.loc[signal_above_zero_line, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[signal_below_zero_line, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[signal_above_zero_line, _ALLOC] = max_investment
+    df.loc[signal_below_zero_line, _ALLOC] = -max_investment
     return df
 
 
@@ -650,9 +657,9 @@ def RSI_strategy(df: pd.DataFrame, window: int = 14, max_investment: float = 0.1
     under_valued = rsi <= 30
     hold = rsi.between(30, 70)
 
-    df.loc[over_valued, PandasEnum.ALLOCATION.value] = -max_investment
-    df.loc[under_valued, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[hold, PandasEnum.ALLOCATION.value] = 0.0
+    df.loc[over_valued, _ALLOC] = -max_investment
+    df.loc[under_valued, _ALLOC] = max_investment
+    df.loc[hold, _ALLOC] = 0.0
     return df
 
 
@@ -668,10 +675,10 @@ def stochastic_RSI_strategy(df: pd.DataFrame, window: int = 14, max_investment:
     under_valued = stoch_rsi <= 0.2
     hold = stoch_rsi.between(0.2, 0.8)
 
-    df.loc[over_valued, PandasEnum.ALLOCATION.value] = -max_investment
-    df.loc[under_valued, PandasEnum.ALLOCATION.value] = max_investment
+    df.loc[over_valued, _ALLOC] = -max_investment
+    df.loc[under_valued, _ALLOC] = max_investment
 
-    df.loc[hold, PandasEnum.ALLOCATION.value] = 0.0
+    df.loc[hold, _ALLOC] = 0.0
     return df
 
 
@@ -684,8 +691,8 @@ def EMA_strategy(df: pd.DataFrame, window: int = 50, max_investment: float = 0.1
     price_above_signal = df["close"] > ema
     price_below_signal = df["close"] <= ema
 
-    df.loc[price_above_signal, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[price_below_signal, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[price_above_signal, _ALLOC] = max_investment
+    df.loc[price_below_signal, _ALLOC] = -max_investment
     return df
 
 
@@ -723,14 +730,14 @@ def bollinger_band_strategy(
 
         # allocation conditions
         if short_position:
-            df.loc[index, PandasEnum.ALLOCATION.value] = max_investment
+            df.loc[index, _ALLOC] = max_investment
 
         elif long_position:
-            df.loc[index, PandasEnum.ALLOCATION.value] = -max_investment
+            df.loc[index, _ALLOC] = -max_investment
 
         else:
             # if both short position and long position is false
-            df.loc[index, PandasEnum.ALLOCATION.value] = 0.0
+            df.loc[index, _ALLOC] = 0.0
 
     return df
 
@@ -744,8 +751,8 @@ def DPO_strategy(df: pd.DataFrame, window: int = 20, max_investment: float = 0.1
     above_zero = dpo > 0
     below_zero = dpo <= 0
 
-    df.loc[above_zero, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[below_zero, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[above_zero, _ALLOC] = max_investment
+    df.loc[below_zero, _ALLOC] = -max_investment
     return df
 
 
@@ -760,8 +767,8 @@ def PPO_strategy(
     above_zero = ppo > 0
     below_zero = ppo <= 0
 
-    df.loc[above_zero, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[below_zero, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[above_zero, _ALLOC] = max_investment
+    df.loc[below_zero, _ALLOC] = -max_investment
     return df
 
 
@@ -776,8 +783,8 @@ def PVO_strategy(
     above_zero = PVO > 0
     below_zero = PVO <= 0
 
-    df.loc[above_zero, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[below_zero, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[above_zero, _ALLOC] = max_investment
+    df.loc[below_zero, _ALLOC] = -max_investment
     return df
 
 
@@ -790,8 +797,8 @@ def TRIX_strategy(df: pd.DataFrame, window: int = 14, max_investment: float = 0.
     above_zero = trix > 0
     below_zero = trix <= 0
 
-    df.loc[above_zero, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[below_zero, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[above_zero, _ALLOC] = max_investment
+    df.loc[below_zero, _ALLOC] = -max_investment
     return df
 
 
@@ -807,8 +814,8 @@ def TSI_strategy(
     above_signal = df_with_signals["TSI"] > df_with_signals["signal"]
     below_signal = df_with_signals["TSI"] <= df_with_signals["signal"]
 
-    df.loc[above_signal, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[below_signal, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[above_signal, _ALLOC] = max_investment
+    df.loc[below_signal, _ALLOC] = -max_investment
     return df
 
 
@@ -832,9 +839,9 @@ def STC_strategy(
     overbought = stc >= 75
     hold = stc.between(25, 75)
 
-    df.loc[oversold, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[overbought, PandasEnum.ALLOCATION.value] = -max_investment
-    df.loc[hold, PandasEnum.ALLOCATION.value] = 0
+    df.loc[oversold, _ALLOC] = max_investment
+    df.loc[overbought, _ALLOC] = -max_investment
+    df.loc[hold, _ALLOC] = 0
 
     return df
 
@@ -852,8 +859,8 @@ def KAMA_strategy(
     downtrend = df_with_signals["signal"] <= df_with_signals["close"]
     uptrend = df_with_signals["signal"] > df_with_signals["close"]
 
-    df.loc[uptrend, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[downtrend, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[uptrend, _ALLOC] = max_investment
+    df.loc[downtrend, _ALLOC] = -max_investment
 
     return df
 
@@ -873,8 +880,8 @@ def aroon_strategy(df: pd.DataFrame, window: int = 25, max_investment: float = 0
     bullish = df_with_signals["aroon_up"] >= df_with_signals["aroon_down"]
     bearish = df_with_signals["aroon_down"] < df_with_signals["aroon_up"]
 
-    df.loc[bullish, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[bearish, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[bullish, _ALLOC] = max_investment
+    df.loc[bearish, _ALLOC] = -max_investment
 
     return df
 
@@ -888,8 +895,8 @@ def ROC_strategy(df: pd.DataFrame, window: int = 12, max_investment: float = 0.1
     uptrend = df_with_signals["signal"] >= 0
     downtrend = df_with_signals["signal"] < 0
 
-    df.loc[uptrend, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[downtrend, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[uptrend, _ALLOC] = max_investment
+    df.loc[downtrend, _ALLOC] = -max_investment
 
     return df
 
@@ -913,13 +920,13 @@ def ADX_strategy(df: pd.DataFrame, window: int = 14, max_investment: float = 0.1
     for pdi_value, mdi_value, adx_value in zip(plus_di, minus_di, adx):
         # ADX > 25 to avoid risky investment i.e. invest only when trend is strong
         if adx_value > 25 and pdi_value > mdi_value:
-            df.loc[index, PandasEnum.ALLOCATION.value] = max_investment
+            df.loc[index, _ALLOC] = max_investment
 
         elif adx_value > 25 and pdi_value < mdi_value:
-            df.loc[index, PandasEnum.ALLOCATION.value] = -max_investment
+            df.loc[index, _ALLOC] = -max_investment
 
         else:
-            df.loc[index, PandasEnum.ALLOCATION.value] = 0
+            df.loc[index, _ALLOC] = 0
 
         index += 1
 
@@ -935,8 +942,8 @@ def vortex_strategy(df: pd.DataFrame, window: int = 14, max_investment: float =
     uptrend = df_with_signals["VORTEX_POS"] >= df_with_signals["VORTEX_NEG"]
     downtrend = df_with_signals["VORTEX_POS"] < df_with_signals["VORTEX_NEG"]
 
-    df.loc[uptrend, PandasEnum.ALLOCATION.value] = max_investment
-    df.loc[downtrend, PandasEnum.ALLOCATION.value] = -max_investment
+    df.loc[uptrend, _ALLOC] = max_investment
+    df.loc[downtrend, _ALLOC] = -max_investment
 
     return df
 
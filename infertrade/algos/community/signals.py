@@ -18,6 +18,8 @@
 Functions used to compute signals. Signals may be used for visual inspection or as inputs to trading rules.
 """
 
+from typing import Tuple
+
 import pandas as pd
 import numpy as np
 from pandas.core.frame import DataFrame
@@ -48,8 +50,6 @@ from ta.volatility import (
     bollinger_mavg,
     ulcer_index as ulcerindex,
 )
-from infertrade.algos.external.ta import ta_adaptor
-from infertrade.PandasEnum import PandasEnum
 
 
 def normalised_close(df: pd.DataFrame) -> pd.DataFrame:
@@ -134,43 +134,51 @@ def stochastic_relative_strength_index(df: pd.DataFrame, window: int = 14) -> pd
     return df_with_signal
 
 
-def chande_kroll(
+def _chande_kroll_arrays(
     df: pd.DataFrame,
     average_true_range_periods: int = 10,
     average_true_range_multiplier: float = 1.0,
     stop_periods: int = 9,
-) -> pd.DataFrame:
-    """
-    Calculates signals for the Chande-Kroll stop.
-
-    See here: https://www.tradingview.com/support/solutions/43000589105-chande-kroll-stop
-    """
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculates the Chande-Kroll stop long and stop short lines as arrays, without adding columns to the dataframe."""
 
     # Calculate the maximum and minum prices that the asset attained in the last
     # average_true_range_periods periods
     max_in_n_periods = df["high"].rolling(window=average_true_range_periods).max()
     min_in_n_periods = df["low"].rolling(window=average_true_range_periods).min()
 
-    # Calculate the Average True Range indicator using average_true_range_periods periods, and
-    # temporarily store those values in df[PandasEnum.SIGNAL.value]
-    adapted_average_true_range = ta_adaptor(
-        AverageTrueRange, "average_true_range", window=average_true_range_periods, fillna=False
-    )
-
-    signal_transformer = scikit_signal_factory(adapted_average_true_range)
-    signal_transformer.fit_transform(df)
+    # Calculate the Average True Range indicator using average_true_range_periods periods
+    average_true_range = AverageTrueRange(
+        high=df["high"], low=df["low"], close=df["close"], window=average_true_range_periods, fillna=False
+    ).average_true_range()
 
     # Calculate the intermediate high and low stops
-    intermediate_high_stops = max_in_n_periods - (df[PandasEnum.SIGNAL.value] * average_true_range_multiplier)
-    intermediate_low_stops = min_in_n_periods + (df[PandasEnum.SIGNAL.value] * average_true_range_multiplier)
+    intermediate_high_stops = max_in_n_periods - (average_true_range * average_true_range_multiplier)
+    intermediate_low_stops = min_in_n_periods + (average_true_range * average_true_range_multiplier)
 
     # Obtain the stop long and stop short values
-    df["chande_kroll_long"] = intermediate_high_stops.rolling(window=stop_periods).max()
-    df["chande_kroll_short"] = intermediate_low_stops.rolling(window=stop_periods).min()
+    chande_kroll_long = intermediate_high_stops.rolling(window=stop_periods).max().to_numpy()
+    chande_kroll_short = intermediate_low_stops.rolling(window=stop_periods).min().to_numpy()
+    return chande_kroll_long, chande_kroll_short
+
 
-    # Drop the Average True Range indicator values before returning
-    df.drop(columns=PandasEnum.SIGNAL.value, inplace=True)
+def chande_kroll(
+    df: pd.DataFrame,
+    average_true_range_periods: int = 10,
+    average_true_range_multiplier: float = 1.0,
+    stop_periods: int = 9,
+) -> pd.DataFrame:
+    """
+    Calculates signals for the Chande-Kroll stop.
 
+    See here: https://www.tradingview.com/support/solutions/43000589105-chande-kroll-stop
+    """
+    df["chande_kroll_long"], df["chande_kroll_short"] = _chande_kroll_arrays(
+        df,
+        average_true_range_periods=average_true_range_periods,
+        average_true_range_multiplier=average_true_range_multiplier,
+        stop_periods=stop_periods,
+    )
     return df
 
 
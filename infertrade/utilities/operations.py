@@ -19,21 +19,25 @@ This submodule includes facilities for operations such as converting positions t
 """
 
 
+import logging
 from copy import deepcopy
-from typing import List, Tuple, Union
+from functools import lru_cache
+from typing import Tuple, Union
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from sklearn.base import TransformerMixin, BaseEstimator
 from sklearn.compose import ColumnTransformer
 from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_squared_error
 
 from sklearn.pipeline import make_pipeline, FeatureUnion
 from sklearn.preprocessing import FunctionTransformer
 from infertrade.utilities.performance import calculate_portfolio_performance_python
 from infertrade.PandasEnum import PandasEnum, create_price_column_from_synonym
 
+logger = logging.getLogger(__name__)
+
 
 def pct_chg(x: Union[np.ndarray, pd.Series]) -> np.ndarray:
     """Percentage change between the current and a prior element.
@@ -217,10 +221,14 @@ class PricePredictionFromSignalRegression(TransformerMixin, BaseEstimator):
         return target
 
     @staticmethod
-    def _get_model_prediction_indices(series_length: int, reg_period: int, forecast_period: int) -> List[dict]:
+    @lru_cache(maxsize=128)
+    def _get_model_prediction_indices(series_length: int, reg_period: int, forecast_period: int) -> Tuple[dict, ...]:
         """
         Create list of ranges for rolling regression.
 
+        The ranges only depend on the three lengths, so results are cached and returned as a tuple that must not be
+        modified.
+
         Parameters
         ----------
         series_length - total length of series
@@ -258,7 +266,36 @@ class PricePredictionFromSignalRegression(TransformerMixin, BaseEstimator):
                 {"model_idx": range(ind_start, ind_end), "prediction_idx": range(ind_pred_start, ind_pred_end)}
             )
 
-        return indices_for_prediction
+        return tuple(indices_for_prediction)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_model_prediction_bounds(
+        series_length: int, reg_period: int, forecast_period: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Create the ranges of _get_model_prediction_indices as arrays of bounds for rolling regression.
+
+        Parameters
+        ----------
+        series_length - total length of series
+        reg_period - regression period
+        forecast_period - forecast period
+
+        Returns
+        -------
+        - model_starts are the starts of the ranges for model fitting, each of which is reg_period long
+        - prediction_starts and prediction_ends are the bounds of the ranges for forecasting
+
+        The arrays are cached, so they are read-only.
+        """
+        model_starts = np.arange(0, max(series_length - reg_period, 0), forecast_period)
+        prediction_starts = model_starts + reg_period
+        prediction_ends = np.minimum(prediction_starts + forecast_period, series_length)
+
+        for bounds in (model_starts, prediction_starts, prediction_ends):
+            bounds.flags.writeable = False
+        return model_starts, prediction_starts, prediction_ends
 
 
 class PositionsFromPricePrediction(TransformerMixin, BaseEstimator):
@@ -489,6 +526,247 @@ def add_two_possibly_zero_length_arrays(
     return regression_period_signal_error
 
 
+def _linear_prediction(model: LinearRegression, features: np.ndarray) -> np.ndarray:
+    """Predicts from a fitted linear regression directly, skipping the input validation of LinearRegression.predict."""
+    return features @ model.coef_.T + model.intercept_
+
+
+def _allocation_array(
+    dataframe: pd.DataFrame, prediction_starts: np.ndarray, prediction_ends: np.ndarray
+) -> np.ndarray:
+    """
+    Copies the allocations of the dataframe to a float array.
+
+    If there are no allocations yet, the rows outside the prediction ranges are NaN and the rows inside them are left
+    uninitialised for the caller to overwrite.
+    """
+    if PandasEnum.ALLOCATION.value in dataframe.columns:
+        return dataframe[PandasEnum.ALLOCATION.value].to_numpy(dtype="float64", copy=True)
+
+    allocations = np.empty(len(dataframe), dtype="float64")
+    if len(prediction_starts) == 0:
+        allocations.fill(np.nan)
+    else:
+        # The prediction ranges follow on from each other, so only the rows either side of them need filling.
+        allocations[: prediction_starts[0]] = np.nan
+        allocations[prediction_ends[-1] :] = np.nan
+    return allocations
+
+
+def _window_sums(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Sums the values from each start (inclusive) to each end (exclusive) by differencing a cumulative sum."""
+    cumulative_sum = np.concatenate((np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis=0)))
+    return cumulative_sum[ends] - cumulative_sum[starts]
+
+
+def _window_standard_deviations(values: np.ndarray, window_starts: np.ndarray, window_length: int) -> np.ndarray:
+    """Calculates the standard deviation of all the values in each window of rows."""
+    values = np.asarray(values, dtype="float64")
+    values = np.reshape(values, (len(values), -1))
+    windows = sliding_window_view(values, window_length, axis=0)[window_starts]
+    return np.std(windows, axis=(1, 2))
+
+
+def _check_finite_regression_inputs(
+    feature_matrix: np.ndarray,
+    last_feature_row: np.ndarray,
+    target_array: np.ndarray,
+    model_starts: np.ndarray,
+    prediction_ends: np.ndarray,
+    regression_period: int,
+):
+    """Raises a ValueError, as LinearRegression does, if any value the rolling regressions use is not finite."""
+    values_used = (
+        feature_matrix[model_starts[0] : prediction_ends[-1]],
+        last_feature_row,
+        target_array[model_starts[0] : model_starts[-1] + regression_period],
+    )
+    for values in values_used:
+        if not np.isfinite(np.asarray(values, dtype="float64")).all():
+            raise ValueError("Input contains NaN, infinity or a value too large for dtype('float64').")
+
+
+def _log_windows_without_variation(price_varies: np.ndarray, signal_varies: np.ndarray):
+    """Logs a single warning for each kind of regression window without variation in its inputs."""
+    price_flat_count = np.count_nonzero(~price_varies)
+    signal_flat_count = np.count_nonzero(price_varies & ~signal_varies)
+    if price_flat_count > 0:
+        logger.warning("Price had no variation in %d of %d regression windows.", price_flat_count, len(price_varies))
+    if signal_flat_count > 0:
+        logger.warning(
+            "Signal had no variation in %d of %d regression windows. Usually this means the lookback period was too"
+            " short for the data sample.",
+            signal_flat_count,
+            len(signal_varies),
+        )
+
+
+def _rolling_univariate_regression(
+    feature_array: np.ndarray,
+    target_array: np.ndarray,
+    model_starts: np.ndarray,
+    regression_period: int,
+    fit_start: int,
+    fit_length: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fits a single feature ordinary least squares regression to every rolling window in closed form.
+
+    Each window starts at an entry of model_starts and is regression_period long. The fit_length values from fit_start
+    onwards in the window are used for fitting, with the error measured on the remaining values (or in sample if there
+    are none).
+
+    Returns the intercepts, slopes and root mean squared errors of the windows, and whether the target and the feature
+    varied during each fitting period.
+    """
+    fit_starts = model_starts + fit_start
+    fit_ends = fit_starts + fit_length
+    in_sample_error = fit_length == regression_period
+    if in_sample_error:
+        segment_starts, segment_ends = [fit_starts], [fit_ends]
+        error_length = fit_length
+    else:
+        # The error is measured on the values either side of the fitting period.
+        model_ends = model_starts + regression_period
+        segment_starts, segment_ends = [fit_starts, model_starts, fit_ends], [fit_ends, fit_starts, model_ends]
+        error_length = regression_period - fit_length
+
+    # Centring on the series means limits the cancellation error when differencing the cumulative sums.
+    feature_offset, target_offset = feature_array.mean(), target_array.mean()
+    x = feature_array - feature_offset
+    y = target_array - target_offset
+
+    # The sums of the values, their squares and their cross product over both the fitting and error periods are all
+    # taken from a single cumulative sum of the stacked moments.
+    moment_sums = _window_sums(
+        np.column_stack((x, y, x * x, x * y, y * y)), np.concatenate(segment_starts), np.concatenate(segment_ends)
+    )
+    segment_sums = np.split(moment_sums, len(segment_starts))
+    fit_sums = segment_sums[0]
+    error_sums = fit_sums if in_sample_error else segment_sums[1] + segment_sums[2]
+    fit_sum_x, fit_sum_y, fit_sum_xx, fit_sum_xy, _ = fit_sums.T
+    error_sum_x, error_sum_y, error_sum_xx, error_sum_xy, error_sum_yy = error_sums.T
+
+    # Fit each window from its sums.
+    mean_x = fit_sum_x / fit_length
+    mean_y = fit_sum_y / fit_length
+    centred_sum_xx = fit_sum_xx - fit_sum_x * mean_x
+    centred_sum_xy = fit_sum_xy - fit_sum_x * mean_y
+
+    # Variation is detected exactly, by counting the changes between consecutive values within each fitting period.
+    feature_changes = np.concatenate(([0], np.cumsum(feature_array[1:] != feature_array[:-1])))
+    target_changes = np.concatenate(([0], np.cumsum(target_array[1:] != target_array[:-1])))
+    signal_varies = feature_changes[fit_ends - 1] > feature_changes[fit_starts]
+    price_varies = target_changes[fit_ends - 1] > target_changes[fit_starts]
+
+    # Without any variation in the feature or the target the least squares solution has no slope, as with
+    # LinearRegression. A constant target is then fitted exactly by its value, free of the rounding in the sums.
+    slopes = np.divide(
+        centred_sum_xy, centred_sum_xx, out=np.zeros(len(model_starts)), where=signal_varies & price_varies
+    )
+    constant_targets = target_array[fit_starts]
+    centred_intercepts = np.where(price_varies, mean_y - slopes * mean_x, constant_targets - target_offset)
+
+    # Residual sum of squares over each error period, expanded in terms of the window sums.
+    residual_sum_of_squares = (
+        error_sum_yy
+        - 2 * centred_intercepts * error_sum_y
+        - 2 * slopes * error_sum_xy
+        + error_length * centred_intercepts ** 2
+        + 2 * centred_intercepts * slopes * error_sum_x
+        + slopes ** 2 * error_sum_xx
+    )
+    model_errors = np.sqrt(np.maximum(residual_sum_of_squares, 0.0) / error_length)
+
+    intercepts = np.where(price_varies, target_offset + centred_intercepts - slopes * feature_offset, constant_targets)
+    return intercepts, slopes, model_errors, price_varies, signal_varies
+
+
+def _univariate_regression_allocations_with_kelly_optimum(
+    allocations: np.ndarray,
+    feature_matrix: np.ndarray,
+    last_feature_row: np.ndarray,
+    target_array: np.ndarray,
+    model_starts: np.ndarray,
+    prediction_starts: np.ndarray,
+    prediction_ends: np.ndarray,
+    regression_period: int,
+    fit_start: int,
+    fit_length: int,
+    kelly_fraction: float = 1.0,
+) -> np.ndarray:
+    """
+    Calculates the Kelly optimum allocations for a regression on a single feature, fitting all windows at once.
+
+    This is a vectorised equivalent of the rolling regression loop in
+    calculate_regression_allocations_with_kelly_optimum.
+    """
+    feature_array = np.reshape(feature_matrix, (-1,)).astype("float64")
+    target_array = np.reshape(target_array, (-1,)).astype("float64")
+    model_ends = model_starts + regression_period
+
+    # All windows are fitted from running sums, so a value that is not finite would spread to every window.
+    _check_finite_regression_inputs(
+        feature_array, last_feature_row, target_array, model_starts, prediction_ends, regression_period
+    )
+
+    intercepts, slopes, model_errors, price_varies, signal_varies = _rolling_univariate_regression(
+        feature_array, target_array, model_starts, regression_period, fit_start, fit_length
+    )
+
+    # We check if either input has zero changes - if so there is no regression relationship.
+    _log_windows_without_variation(price_varies, signal_varies)
+    bad_inputs = price_varies & ~signal_varies
+
+    # Calculate drift and volatility
+    forecast_distance = 1
+    volatility = ((1 + model_errors) * (forecast_distance ** -0.5)) - 1
+    if np.any(volatility[~bad_inputs] < 0):
+        raise ZeroDivisionError("Volatility needs to be positive value.")
+
+    # Flooring volatility at last 20 step recent volatility.
+    window_length_recent_vol = min(20, regression_period)
+    recent_target_windows = sliding_window_view(target_array, window_length_recent_vol)
+    recent_fractional_realised_vol = np.std(recent_target_windows[model_ends - window_length_recent_vol], axis=1)
+    volatility = np.maximum(volatility, recent_fractional_realised_vol)
+
+    # Absolute floor for volatility at 0.01% == 1bp
+    minimum_volatility = 0.0001
+    volatility = np.maximum(volatility, minimum_volatility)
+    volatility[bad_inputs] = 1.0
+
+    # Calculate Kelly fraction to invest. The forecast is linear in the research value, so the Kelly scaling of each
+    # window is folded into its coefficients and each prediction only needs a multiply and an add.
+    kelly_scale = kelly_fraction / volatility ** 2
+    kelly_intercepts = intercepts * kelly_scale
+    kelly_slopes = slopes * kelly_scale
+
+    # Each prediction uses the model of the window immediately preceding it.
+    prediction_lengths = prediction_ends - prediction_starts
+    prediction_window = np.repeat(np.arange(len(model_starts)), prediction_lengths)
+    prediction_offsets = prediction_starts - (np.cumsum(prediction_lengths) - prediction_lengths)
+    prediction_rows = np.arange(prediction_lengths.sum()) + prediction_offsets[prediction_window]
+    rule_recommended_allocation = kelly_slopes[prediction_window]
+    rule_recommended_allocation *= feature_array[prediction_rows]
+    rule_recommended_allocation += kelly_intercepts[prediction_window]
+    np.copyto(rule_recommended_allocation, 0.0, where=bad_inputs[prediction_window])
+
+    # Apply the calculated allocation to the existing allocations.
+    allocations[prediction_rows] = rule_recommended_allocation
+
+    # Lead the allocations by one step, so each bar holds the allocation forecast for the bar after it.
+    allocations[:-1] = allocations[1:]
+
+    # Calculate price forecast for last research value
+    if price_varies[-1] and signal_varies[-1]:
+        value_to_update = kelly_intercepts[-1] + kelly_slopes[-1] * np.reshape(last_feature_row, (-1,))[0]
+    else:
+        value_to_update = 0.0
+    allocations[-1] = value_to_update
+
+    return allocations
+
+
 def calculate_regression_with_kelly_optimum(
     df: pd.DataFrame,
     feature_matrix: pd.Series,
@@ -504,16 +782,97 @@ def calculate_regression_with_kelly_optimum(
     price changes.
     """
     dataframe = df.copy()
-    prediction_indices = PricePredictionFromSignalRegression._get_model_prediction_indices(
+    dataframe[PandasEnum.ALLOCATION.value] = calculate_regression_allocations_with_kelly_optimum(
+        dataframe,
+        feature_matrix=feature_matrix,
+        last_feature_row=last_feature_row,
+        target_array=target_array,
+        regression_period=regression_period,
+        forecast_period=forecast_period,
+        kelly_fraction=kelly_fraction,
+        out_of_sample_error=out_of_sample_error,
+    )
+    return dataframe
+
+
+def calculate_regression_allocations_with_kelly_optimum(
+    df: pd.DataFrame,
+    feature_matrix: pd.Series,
+    last_feature_row: np.ndarray,
+    target_array: pd.Series,
+    regression_period: int,
+    forecast_period: int,
+    kelly_fraction: float = 1.0,
+    out_of_sample_error: bool = False,
+) -> np.ndarray:
+    """
+    Calculates the allocations of calculate_regression_with_kelly_optimum as an array, without copying the dataframe.
+
+    Any existing allocations in the dataframe are used for the entries that are not forecast. A one dimensional
+    feature matrix is treated as a single feature.
+    """
+    model_starts, prediction_starts, prediction_ends = PricePredictionFromSignalRegression._get_model_prediction_bounds(
         series_length=len(feature_matrix), reg_period=regression_period, forecast_period=forecast_period
     )
+    allocations = _allocation_array(df, prediction_starts, prediction_ends)
+
+    if out_of_sample_error:
+        # In this mode we calculate the error out of sample rather than using the calibration error.
+        start_error_pct = 0.0
+        end_error_pct = 0.25  # unused as fits to remaining values in series
+        fit_pct = 1.0 - start_error_pct - end_error_pct
+        if fit_pct <= 0.0:
+            raise IndexError("No data selected for calibration.")
+        elif fit_pct <= 0.1:
+            logger.warning("Very low fit percentage for calibration.")
+        elif fit_pct >= 1.0:
+            raise IndexError("No data selected for error calculation.")
+        elif fit_pct >= 0.99:
+            logger.warning("Very little data provided for error calculation.")
+        fit_start = int(regression_period * start_error_pct)
+        fit_length = int(regression_period * (fit_pct + start_error_pct)) - fit_start
+    else:
+        fit_start = 0
+        fit_length = regression_period
+
+    if len(model_starts) > 0 and (np.ndim(feature_matrix) == 1 or np.shape(feature_matrix)[1] == 1):
+        # With a single feature the regressions have a closed form, so all windows are calculated together.
+        allocations = _univariate_regression_allocations_with_kelly_optimum(
+            allocations,
+            feature_matrix=feature_matrix,
+            last_feature_row=last_feature_row,
+            target_array=target_array,
+            model_starts=model_starts,
+            prediction_starts=prediction_starts,
+            prediction_ends=prediction_ends,
+            regression_period=regression_period,
+            fit_start=fit_start,
+            fit_length=fit_length,
+            kelly_fraction=kelly_fraction,
+        )
 
-    bad_inputs = False
-    if len(prediction_indices) > 0:
-        for ii_day in range(len(prediction_indices)):
-            model_idx = prediction_indices[ii_day]["model_idx"]
-            prediction_idx = prediction_indices[ii_day]["prediction_idx"]
-            regression_period_signal = feature_matrix[model_idx, :]
+    elif len(model_starts) > 0:
+        # Windows containing values that are not finite cannot be fitted, and must not be mistaken for flat inputs.
+        _check_finite_regression_inputs(
+            feature_matrix, last_feature_row, target_array, model_starts, prediction_ends, regression_period
+        )
+
+        # We check if either input has zero changes - if so there is no regression relationship.
+        std_prices = _window_standard_deviations(target_array, model_starts + fit_start, fit_length)
+        std_signals = _window_standard_deviations(feature_matrix, model_starts + fit_start, fit_length)
+        price_varies = std_prices > 0.0
+        signal_varies = std_signals > 0.0
+        _log_windows_without_variation(price_varies, signal_varies)
+        # Each window is judged on its own inputs, so that no state is carried from one window to the next.
+        bad_inputs = price_varies & ~signal_varies
+
+        for ii_window, (model_start, prediction_start, prediction_end) in enumerate(
+            zip(model_starts, prediction_starts, prediction_ends)
+        ):
+            # The index ranges are contiguous, so slicing gives views of the windows rather than copies.
+            model_idx = slice(model_start, model_start + regression_period)
+            prediction_idx = slice(prediction_start, prediction_end)
+            regression_period_signal = feature_matrix[model_idx]
             regression_period_price_change = target_array[model_idx]
             regression_period_signal_fit = regression_period_signal
             regression_period_signal_error = regression_period_signal
@@ -521,30 +880,11 @@ def calculate_regression_with_kelly_optimum(
             regression_period_price_change_error = regression_period_price_change
 
             if out_of_sample_error:
-                # In this mode we calculate the error out of sample rather than using the calibration error.
-                start_error_pct = 0.0
-                end_error_pct = 0.25  # unused as fits to remaining values in series
-                fit_pct = 1.0 - start_error_pct - end_error_pct
-                if fit_pct <= 0.0:
-                    raise IndexError("No data selected for calibration.")
-                elif fit_pct <= 0.1:
-                    print("WARNING - very low fit percentage for calibration.")
-                elif fit_pct >= 1.0:
-                    raise IndexError("No data selected for error calculation.")
-                elif fit_pct >= 0.99:
-                    print("WARNING - very little data provided for error calculation.")
-
                 (
                     regression_period_signal_error_start,
                     regression_period_signal_fit,
                     regression_period_signal_error_end,
-                ) = np.split(
-                    regression_period_signal,
-                    [
-                        int(len(regression_period_signal) * start_error_pct),
-                        int(len(regression_period_signal) * (fit_pct + start_error_pct)),
-                    ],
-                )
+                ) = np.split(regression_period_signal, [fit_start, fit_start + fit_length])
                 regression_period_signal_fit = regression_period_signal_fit
 
                 regression_period_signal_error = add_two_possibly_zero_length_arrays(
@@ -555,36 +895,14 @@ def calculate_regression_with_kelly_optimum(
                     regression_period_price_change_error_start,
                     regression_period_price_change_fit,
                     regression_period_price_change_error_end,
-                ) = np.split(
-                    regression_period_price_change,
-                    [
-                        int(len(regression_period_price_change) * start_error_pct),
-                        int(len(regression_period_price_change) * (start_error_pct + fit_pct)),
-                    ],
-                )
+                ) = np.split(regression_period_price_change, [fit_start, fit_start + fit_length])
                 regression_period_price_change_fit = regression_period_price_change_fit
                 regression_period_price_change_error = add_two_possibly_zero_length_arrays(
                     regression_period_price_change_error_start, regression_period_price_change_error_end
                 )
 
             try:
-                # We check if either input has zero changes - if so there is no regression relationship.
-                std_price = np.std(regression_period_price_change_fit)
-                std_signal = np.std(regression_period_signal_fit)
-
-                if not std_price > 0.0:
-                    print("WARNING - price had no variation: ", std_price)
-                elif not std_signal > 0.0:
-                    print(
-                        "WARNING - signal had no variation. Usually this means the lookback period was too short"
-                        " for the data sample: ",
-                        std_signal,
-                    )
-                    bad_inputs = True
-                else:
-                    bad_inputs = False
-
-                if bad_inputs:
+                if bad_inputs[ii_window]:
                     # Assuming no bad inputs we calculate the recommended allocation
                     rule_recommended_allocation = 0.0
                     volatility = 1.0
@@ -594,15 +912,15 @@ def calculate_regression_with_kelly_optimum(
                     )
 
                     # Calculate model error
-                    predictions = rolling_regression_model.predict(regression_period_signal_error)
+                    predictions = _linear_prediction(rolling_regression_model, regression_period_signal_error)
                     forecast_horizon_model_error = np.sqrt(
-                        mean_squared_error(regression_period_price_change_error, predictions)
+                        np.mean((regression_period_price_change_error - predictions) ** 2)
                     )
 
                     # Predictions
                     forecast_distance = 1
-                    current_research = feature_matrix[prediction_idx, :]
-                    forecast_price_change = rolling_regression_model.predict(current_research)
+                    current_research = feature_matrix[prediction_idx]
+                    forecast_price_change = _linear_prediction(rolling_regression_model, current_research)
 
                     # Calculate drift and volatility
                     volatility = ((1 + forecast_horizon_model_error) * (forecast_distance ** -0.5)) - 1
@@ -632,27 +950,27 @@ def calculate_regression_with_kelly_optimum(
                 # np.zeros(len(prediction_idx))
                 rule_recommended_allocation = 0.0
 
-            # Apply the calculated allocation to the dataframe.
-            dataframe.loc[prediction_idx, PandasEnum.ALLOCATION.value] = rule_recommended_allocation.reshape(-1,)
+            # Store the calculated allocation for the prediction period.
+            allocations[prediction_idx] = np.reshape(rule_recommended_allocation, (-1,))
 
-        # Shift position series  (QUESTION - does not appear to shift?)
-        dataframe[PandasEnum.ALLOCATION.value] = dataframe[PandasEnum.ALLOCATION.value].shift(-1)
+        # Lead the allocations by one step, so each bar holds the allocation forecast for the bar after it.
+        allocations[:-1] = allocations[1:]
 
         # Calculate price forecast for last research value
-        if std_price > 0.0 and std_signal > 0.0:
+        if price_varies[-1] and signal_varies[-1]:
             # last_research = [[dataframe[PandasEnum.SIGNAL.value].iloc[-1]]]
             last_research = last_feature_row
-            last_forecast_price = rolling_regression_model.predict(last_research)[0]
+            last_forecast_price = _linear_prediction(rolling_regression_model, last_research)[0]
             value_to_update = kelly_fraction * (last_forecast_price / volatility ** 2)
         else:
             value_to_update = 0.0
-        dataframe.iloc[-1, dataframe.columns.get_loc(PandasEnum.ALLOCATION.value)] = value_to_update
+        allocations[-1] = value_to_update
 
     else:
         # If length of prediction indices is zero we set all positions to zero.
-        dataframe[PandasEnum.ALLOCATION.value] = 0.0
+        allocations = np.zeros(len(df))
 
-    return dataframe
+    return allocations
 
 
 def scikit_allocation_factory(allocation_function: callable) -> FunctionTransformer:
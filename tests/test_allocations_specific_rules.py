@@ -389,3 +389,59 @@ def test_donchainstrategy(df):
     df_with_signals.loc[up_sig.index, "allocation"] = max_investment
     df_with_signals.loc[dwn_sig.index, "allocation"] = -max_investment
     assert pd.Series.equals(df_with_signals["allocation"], df_with_allocations["allocation"])
+
+
+@pytest.mark.parametrize("df", dataframes)
+def test_sma_crossover_strategy(df):
+    """Checks SMA crossover strategy calculates correctly."""
+    df_with_price = df.copy()
+    df_with_price["price"] = df_with_price["close"]
+    df_with_allocations = allocations.sma_crossover_strategy(df_with_price.copy(), fast=5, slow=20)
+
+    fast_sma = df_with_price["price"].rolling(window=5, min_periods=5).mean()
+    slow_sma = df_with_price["price"].rolling(window=20, min_periods=20).mean()
+    df_with_price["allocation"] = np.where(fast_sma > slow_sma, 1.0, 0.0)
+    assert pd.Series.equals(df_with_price["allocation"], df_with_allocations["allocation"])
+
+
+def test_sma_crossover_strategy_with_infinite_price():
+    """Checks an infinite price only affects the moving averages of the windows containing it."""
+    price = np.linspace(1, 2, 60)
+    price[10] = np.inf
+    df_with_allocations = allocations.sma_crossover_strategy(pd.DataFrame({"price": price}), fast=3, slow=5)
+
+    fast_sma = pd.Series(price).rolling(window=3, min_periods=3).mean()
+    slow_sma = pd.Series(price).rolling(window=5, min_periods=5).mean()
+    assert np.array_equal(df_with_allocations["allocation"], np.where(fast_sma > slow_sma, 1.0, 0.0))
+    assert (df_with_allocations["allocation"].iloc[15:] == 1.0).all()
+
+
+@pytest.mark.parametrize("df", dataframes)
+def test_weighted_moving_averages(df):
+    """Checks weighted moving averages rule calculates correctly."""
+    df_with_price = df.copy()
+    df_with_price["price"] = df_with_price["close"]
+    df_with_allocations = allocations.weighted_moving_averages(
+        df_with_price.copy(), avg_price_coeff=0.3, avg_research_coeff=0.7, avg_price_length=7, avg_research_length=3
+    )
+
+    avg_price = df_with_price["price"].rolling(window=7).mean()
+    avg_research = df_with_price["research"].rolling(window=3).mean()
+    expected_allocation = (0.3 * avg_price + 0.7 * avg_research) / df_with_price["price"]
+    assert np.allclose(expected_allocation, df_with_allocations["allocation"], equal_nan=True)
+
+
+def test_weighted_moving_averages_with_infinite_research():
+    """Checks an infinite research value only affects the allocations of the windows containing it."""
+    price = np.linspace(1, 2, 60)
+    research = np.linspace(1, 2, 60)
+    research[10] = np.inf
+    df_with_allocations = allocations.weighted_moving_averages(
+        pd.DataFrame({"price": price, "research": research}), avg_price_length=3, avg_research_length=3
+    )
+
+    avg_price = pd.Series(price).rolling(window=3).mean()
+    avg_research = pd.Series(research).rolling(window=3).mean()
+    expected_allocation = (avg_price + avg_research) / price
+    assert np.allclose(expected_allocation, df_with_allocations["allocation"], equal_nan=True)
+    assert np.isfinite(df_with_allocations["allocation"].iloc[13:]).all()
@@ -20,8 +20,12 @@
 """Tests directed at the functionality of operations.py"""
 import numpy as np
 import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_squared_error
 
 import infertrade.utilities.operations
+from infertrade.algos.community import allocations
 from infertrade.data.simulate_data import simulated_market_data_4_years_gen
 
 
@@ -62,3 +66,176 @@ def test_calculate_regression_with_kelly_optimum():
     # As we passing a blank feature matrix, we expect all allocations to be zero.
     for ii_entry in output["allocation"]:
         assert ii_entry == 0.0
+
+
+def _seeded_market_data(seed: int, length: int = 1000) -> pd.DataFrame:
+    """Creates reproducible prices with a research series that partly anticipates them."""
+    rng = np.random.default_rng(seed)
+    price = np.cumprod(1 + 0.02 * rng.standard_normal(length))
+    research = price * (1 + 0.01 * rng.standard_normal(length))
+    return pd.DataFrame({"price": price, "research": research})
+
+
+def _reference_regression_allocations(
+    feature_matrix: np.ndarray,
+    last_feature_row: np.ndarray,
+    target_array: np.ndarray,
+    regression_period: int,
+    forecast_period: int,
+    out_of_sample_error: bool,
+) -> np.ndarray:
+    """Calculates Kelly allocations with a LinearRegression fitted to each window in turn."""
+    fit_length = int(regression_period * 0.75) if out_of_sample_error else regression_period
+    allocations = np.full(len(feature_matrix), np.nan)
+    for model_start in range(0, len(feature_matrix) - regression_period, forecast_period):
+        model_rows = slice(model_start, model_start + regression_period)
+        prediction_rows = slice(model_rows.stop, min(model_rows.stop + forecast_period, len(feature_matrix)))
+        signal, price_change = feature_matrix[model_rows], target_array[model_rows]
+        signal_fit, price_change_fit = signal[:fit_length], price_change[:fit_length]
+        if out_of_sample_error:
+            signal_error, price_change_error = signal[fit_length:], price_change[fit_length:]
+        else:
+            signal_error, price_change_error = signal_fit, price_change_fit
+
+        window_is_fitted = not (np.std(price_change_fit) > 0.0 and not np.std(signal_fit) > 0.0)
+        if not window_is_fitted:
+            allocations[prediction_rows] = 0.0
+            continue
+
+        model = LinearRegression().fit(signal_fit, price_change_fit)
+        model_error = np.sqrt(mean_squared_error(price_change_error, model.predict(signal_error)))
+        volatility = max((1 + model_error) - 1, np.std(price_change[-20:]), 0.0001)
+        allocations[prediction_rows] = model.predict(feature_matrix[prediction_rows]).ravel() / volatility ** 2
+
+    allocations = pd.Series(allocations).shift(-1).to_numpy()
+    last_window_varies = np.std(price_change_fit) > 0.0 and np.std(signal_fit) > 0.0
+    allocations[-1] = model.predict(last_feature_row).ravel()[0] / volatility ** 2 if last_window_varies else 0.0
+    return allocations
+
+
+def _relationship_features(df: pd.DataFrame, relationship: str) -> tuple:
+    """Builds the feature matrix, last feature row and target of a relationship rule as separate columns."""
+    price = np.append(df["price"].to_numpy(), 0)
+    research = np.append(df["research"].to_numpy(), 0)
+    if relationship == "level":
+        features = infertrade.utilities.operations.lag(research.reshape(-1, 1), shift=1)
+        features[0] = [0.0]
+    elif relationship == "change":
+        features = infertrade.utilities.operations.pct_chg(
+            infertrade.utilities.operations.lag(research.reshape(-1, 1), shift=1)
+        )
+        features[:2] = [0.0]
+    else:
+        features = infertrade.utilities.operations.research_over_price_minus_one(
+            np.column_stack((price, research)), shift=1
+        )
+        features[0] = [0.0]
+    target = infertrade.utilities.operations.pct_chg(df["price"])
+    target[0] = [0.0]
+    return features[:-1], features[-1:], target
+
+
+@pytest.mark.parametrize("out_of_sample_error", [False, True])
+@pytest.mark.parametrize("relationship", ["level", "change", "difference"])
+@pytest.mark.parametrize("flat_research", [False, True])
+def test_relationship_matches_rolling_linear_regression(relationship, out_of_sample_error, flat_research):
+    """Checks the single feature relationship rules match a LinearRegression fitted to each window."""
+    df = _seeded_market_data(seed=1)
+    if flat_research:
+        # Flat research leaves the level and change features without variation after the first window.
+        df["research"] = 1.0
+
+    rule = getattr(allocations, "calculate_" + relationship + "_relationship")
+    output = rule(df, regression_period=120, out_of_sample_error=out_of_sample_error)
+    expected = _reference_regression_allocations(
+        *_relationship_features(df, relationship),
+        regression_period=120,
+        forecast_period=100,
+        out_of_sample_error=out_of_sample_error,
+    )
+
+    assert np.allclose(output["allocation"], expected, rtol=1e-6, atol=1e-9, equal_nan=True)
+    if flat_research and relationship in ["level", "change"]:
+        assert (output["allocation"].iloc[219:-1] == 0.0).all()
+
+
+@pytest.mark.parametrize("non_finite_value", [np.nan, np.inf])
+@pytest.mark.parametrize("relationship", ["level_relationship", "difference_relationship", "combination_relationship"])
+def test_regression_with_non_finite_research(non_finite_value, relationship):
+    """Checks a research value that is not finite raises, as LinearRegression does, rather than spreading."""
+    df = _seeded_market_data(seed=0)
+    df.loc[700, "research"] = non_finite_value
+
+    with pytest.raises(ValueError):
+        getattr(allocations, relationship)(df)
+
+
+def test_rolling_univariate_regression():
+    """Checks the closed form rolling regression matches a LinearRegression fitted to each window."""
+    rng = np.random.default_rng(0)
+    feature_array = rng.random(300)
+    target_array = 0.5 * feature_array + 0.1 * rng.random(300)
+    model_starts = np.arange(0, 180, 60)
+    regression_period = 120
+
+    for fit_start, fit_length in [(0, regression_period), (0, 90), (10, 90)]:
+        intercepts, slopes, model_errors, _, _ = infertrade.utilities.operations._rolling_univariate_regression(
+            feature_array, target_array, model_starts, regression_period, fit_start, fit_length
+        )
+        for ii_window, ii_start in enumerate(model_starts):
+            fit_rows = np.arange(ii_start + fit_start, ii_start + fit_start + fit_length)
+            if fit_length < regression_period:
+                error_rows = np.setdiff1d(np.arange(ii_start, ii_start + regression_period), fit_rows)
+            else:
+                error_rows = fit_rows
+
+            model = LinearRegression().fit(feature_array[fit_rows].reshape(-1, 1), target_array[fit_rows])
+            predictions = model.predict(feature_array[error_rows].reshape(-1, 1))
+            model_error = np.sqrt(mean_squared_error(target_array[error_rows], predictions))
+
+            assert np.isclose(intercepts[ii_window], model.intercept_)
+            assert np.isclose(slopes[ii_window], model.coef_[0])
+            assert np.isclose(model_errors[ii_window], model_error)
+
+
+def test_rolling_univariate_regression_constant_target():
+    """Checks a window with a constant target is fitted exactly, without rounding residue from the window sums."""
+    feature_array = np.random.default_rng(0).random(300)
+    target_array = np.random.default_rng(1).random(300)
+    target_array[100:250] = 0.0025
+    model_starts = np.arange(0, 180, 60)
+
+    intercepts, slopes, _, price_varies, _ = infertrade.utilities.operations._rolling_univariate_regression(
+        feature_array, target_array, model_starts, 120, 0, 120
+    )
+
+    assert list(price_varies) == [True, True, False]
+    assert slopes[2] == 0.0
+    assert intercepts[2] == 0.0025
+
+
+def test_get_model_prediction_indices():
+    """Checks the rolling regression ranges and that repeated calls reuse the cached result."""
+    get_indices = infertrade.utilities.operations.PricePredictionFromSignalRegression._get_model_prediction_indices
+    prediction_indices = get_indices(series_length=95, reg_period=50, forecast_period=10)
+
+    assert len(prediction_indices) == 5
+    assert prediction_indices[0] == {"model_idx": range(0, 50), "prediction_idx": range(50, 60)}
+    assert prediction_indices[-1] == {"model_idx": range(40, 90), "prediction_idx": range(90, 95)}
+    assert get_indices(series_length=95, reg_period=50, forecast_period=10) is prediction_indices
+
+
+def test_get_model_prediction_bounds():
+    """Checks the bounds arrays describe the same ranges as the list of index ranges."""
+    regression = infertrade.utilities.operations.PricePredictionFromSignalRegression
+    for series_length, reg_period, forecast_period in [(95, 50, 10), (1000, 120, 100), (100, 120, 100)]:
+        prediction_indices = regression._get_model_prediction_indices(series_length, reg_period, forecast_period)
+        model_starts, prediction_starts, prediction_ends = regression._get_model_prediction_bounds(
+            series_length, reg_period, forecast_period
+        )
+
+        assert len(model_starts) == len(prediction_indices)
+        for ii_window, ii_indices in enumerate(prediction_indices):
+            assert ii_indices["model_idx"] == range(model_starts[ii_window], model_starts[ii_window] + reg_period)
+            assert ii_indices["prediction_idx"] == range(prediction_starts[ii_window], prediction_ends[ii_window])
+        assert not model_starts.flags.writeable